@@ -4,13 +4,28 @@
 import os
 import sys
 import time
+import hashlib
+import selectors
 import threading
 import webbrowser
 import http.server
-import socketserver
-from typing import Any
 from pathlib import Path
-from datetime import datetime
+from typing import Any, Optional
+
+# --------------------------------------------------
+# watchdog is optional: OS file-change events (inotify /
+# FSEvents / ReadDirectoryChangesW) when available, falling
+# back to mtime polling otherwise (e.g. NFS mounts)
+# --------------------------------------------------
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+
+    _WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None  # type: ignore
+    FileSystemEventHandler = object  # type: ignore
+    _WATCHDOG_AVAILABLE = False
 
 # --------------------------------------------------
 # local
@@ -18,6 +33,24 @@ from datetime import datetime
 import primitives
 
 
+def _ts() -> str:
+    """Returns the current HH:MM:SS timestamp for status lines
+    (time.strftime is C-implemented; no datetime object per call)."""
+    return time.strftime("%H:%M:%S")
+
+
+class _TemplateChangeHandler(FileSystemEventHandler):  # type: ignore[misc]
+    """Watchdog handler which re-renders whenever the watched template file is modified."""
+
+    def __init__(self, template_path: Path, on_change: Any):
+        self.template_path = str(template_path.resolve())
+        self.on_change = on_change
+
+    def on_modified(self, event: Any):
+        if event.src_path == self.template_path:
+            self.on_change()
+
+
 def debug_mode(
     budget_summary: primitives.Summary,
     template_name: str = "budget-email.html",
@@ -42,7 +75,8 @@ def debug_mode(
         return
 
     # --------------------------------------------------
-    # track last modification time
+    # track last modification time (only used by the
+    # polling fallback when watchdog is unavailable)
     # --------------------------------------------------
     last_mtime = os.path.getmtime(template_path)
 
@@ -53,16 +87,70 @@ def debug_mode(
         def log_message(self, format: str, *args: tuple[Any, ...]):
             pass  # suppress request logs
 
+        def end_headers(self):
+            # --------------------------------------------------
+            # never serve stale cached output after a re-render
+            # --------------------------------------------------
+            self.send_header("Cache-Control", "no-store")
+            super().end_headers()
+
+    # --------------------------------------------------
+    # content hashes for skipping no-op re-renders: mtime
+    # can change without the content changing (save without
+    # edits, git checkout), and re-writing identical HTML
+    # only causes browser auto-reload flicker
+    # --------------------------------------------------
+    prev_tpl_hash: Optional[bytes] = None
+    prev_html_hash: Optional[bytes] = None
+
     def render_html():
         """Render the budget summary to HTML and write to output file"""
+        nonlocal prev_tpl_hash, prev_html_hash
         try:
+            # --------------------------------------------------
+            # skip the render entirely if the template content
+            # is byte-identical to the last render
+            # --------------------------------------------------
+            tpl_hash = hashlib.blake2b(
+                template_path.read_bytes(), digest_size=16
+            ).digest()
+            if tpl_hash == prev_tpl_hash:
+                print(
+                    f"[{_ts()}] Template content unchanged, skipping re-render"
+                )
+                return True
+            # --------------------------------------------------
+            # the shared environment caches compiled templates
+            # (auto_reload is off); drop it so the edit is seen
+            # --------------------------------------------------
+            primitives.invalidate_template_cache()
             html_content = budget_summary.to_email_html(template_path=template_name)
-            output_path.write_text(html_content)
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Rendered to {output_file}")
+            prev_tpl_hash = tpl_hash
+            # --------------------------------------------------
+            # skip the disk write (and the browser reload it
+            # triggers) if the rendered HTML is unchanged
+            # --------------------------------------------------
+            html_hash = hashlib.blake2b(
+                html_content.encode(), digest_size=16
+            ).digest()
+            if html_hash == prev_html_hash:
+                print(
+                    f"[{_ts()}] Rendered HTML unchanged, skipping write"
+                )
+                return True
+            # --------------------------------------------------
+            # atomic write: render to a tmp file and rename so
+            # a concurrent browser fetch never reads a torn file
+            # --------------------------------------------------
+            tmp = output_path.with_suffix(output_path.suffix + ".tmp")
+            tmp.write_text(html_content)
+            os.replace(tmp, output_path)
+            prev_html_hash = html_hash
+            print(f"[{_ts()}] Rendered to {output_file}")
             return True
         except Exception as e:
             print(
-                f"[{datetime.now().strftime('%H:%M:%S')}] Error rendering template: {e}"
+                f"[{_ts()}] Error rendering template: {e}"
             )
             import traceback
 
@@ -76,24 +164,24 @@ def debug_mode(
         """Start the HTTP server to serve the output file"""
         nonlocal httpd, server_thread
         try:
-            httpd = socketserver.TCPServer(("", port), QuietHTTPRequestHandler)
+            # --------------------------------------------------
+            # ThreadingHTTPServer serves overlapping requests
+            # (multiple tabs / live-reload refetches) instead of
+            # serializing them, and sets allow_reuse_address so
+            # quick restarts don't hit TIME_WAIT
+            # --------------------------------------------------
+            httpd = http.server.ThreadingHTTPServer(
+                ("", port), QuietHTTPRequestHandler
+            )
             server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
             server_thread.start()
             print(
-                f"[{datetime.now().strftime('%H:%M:%S')}] Server started at http://localhost:{port}/{output_file}"
+                f"[{_ts()}] Server started at http://localhost:{port}/{output_file}"
             )
             return True
         except OSError as e:
-            if "Address already in use" in str(e):
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Port {port} already in use, server already running"
-                )
-                return True
-            else:
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Error starting server: {e}"
-                )
-                return False
+            print(f"[{_ts()}] Error starting server: {e}")
+            return False
 
     # --------------------------------------------------
     # initial render
@@ -122,9 +210,68 @@ def debug_mode(
     quit_flag = threading.Event()
     restart_flag = threading.Event()
 
-    def input_thread():
-        """Background thread to listen for 'q' (quit) or 'r' (restart) input"""
+    def prompt_new_port():
+        """Asks for a new port, keeping the current one on bad input"""
         nonlocal port
+        try:
+            new_port_input = input(
+                f"Enter new port (or press Enter to keep {port}): "
+            ).strip()
+            if new_port_input:
+                new_port = int(new_port_input)
+                if 1024 <= new_port <= 65535:
+                    port = new_port
+                else:
+                    print(f"Invalid port {new_port}, keeping {port}")
+        except ValueError:
+            print(f"Invalid input, keeping port {port}")
+
+    def do_restart():
+        """Shuts down the server, re-renders, and restarts on the current port"""
+        nonlocal httpd, server_thread
+        print(f"[{_ts()}] Shutting down old server...")
+        if httpd:
+            httpd.shutdown()
+            httpd = None
+            server_thread = None
+
+        print(f"[{_ts()}] Re-rendering HTML...")
+        render_html()
+
+        print(
+            f"[{_ts()}] Starting new server on port {port}..."
+        )
+        if start_server():
+            try:
+                webbrowser.open(f"http://localhost:{port}/{output_file}")
+            except:
+                pass
+            print(
+                f"[{_ts()}] Server restarted successfully!"
+            )
+        else:
+            print(f"[{_ts()}] Failed to restart server")
+
+    def poll_template():
+        """Polling fallback (no watchdog): re-render when the mtime changes"""
+        nonlocal last_mtime
+        try:
+            current_mtime = os.path.getmtime(template_path)
+            if current_mtime != last_mtime:
+                last_mtime = current_mtime
+                print(
+                    f"[{_ts()}] Template changed, re-rendering..."
+                )
+                render_html()
+        except FileNotFoundError:
+            print(
+                f"[{_ts()}] Warning: Template file was deleted!"
+            )
+            time.sleep(1)
+
+    def input_thread():
+        """Background thread to listen for 'q' (quit) or 'r' (restart) input.
+        Only used when stdin is not selectable (e.g. Windows)."""
         try:
             while not quit_flag.is_set():
                 user_input = input()
@@ -135,82 +282,95 @@ def debug_mode(
                     break
                 elif cmd == "r":
                     print("\nRestarting server...")
-                    # Ask for new port
-                    try:
-                        new_port_input = input(
-                            f"Enter new port (or press Enter to keep {port}): "
-                        ).strip()
-                        if new_port_input:
-                            new_port = int(new_port_input)
-                            if 1024 <= new_port <= 65535:
-                                port = new_port
-                            else:
-                                print(f"Invalid port {new_port}, keeping {port}")
-                    except ValueError:
-                        print(f"Invalid input, keeping port {port}")
+                    prompt_new_port()
                     restart_flag.set()
         except:
             pass
 
     # --------------------------------------------------
-    # start input listener thread
+    # start watchdog observer (event-driven, zero CPU while
+    # idle) if available; otherwise fall back to polling
     # --------------------------------------------------
-    listener = threading.Thread(target=input_thread, daemon=True)
-    listener.start()
-
-    try:
-        while not quit_flag.is_set():
-            time.sleep(0.5)  # check every 500ms
+    observer = None
+    if _WATCHDOG_AVAILABLE:
 
-            # Check for restart request
-            if restart_flag.is_set():
-                restart_flag.clear()
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Shutting down old server..."
-                )
-                if httpd:
-                    httpd.shutdown()
-                    httpd = None
-                    server_thread = None
+        def on_template_change():
+            print(
+                f"[{_ts()}] Template changed, re-rendering..."
+            )
+            render_html()
 
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Re-rendering HTML...")
-                render_html()
+        observer = Observer()
+        observer.schedule(
+            _TemplateChangeHandler(template_path, on_template_change),
+            str(template_path.resolve().parent),
+            recursive=False,
+        )
+        observer.start()
 
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Starting new server on port {port}..."
-                )
-                if start_server():
-                    try:
-                        webbrowser.open(f"http://localhost:{port}/{output_file}")
-                    except:
-                        pass
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] Server restarted successfully!"
-                    )
-                else:
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] Failed to restart server"
-                    )
-                continue
+    # --------------------------------------------------
+    # multiplex stdin commands in a selector so the main
+    # loop blocks instead of busy-waiting; fall back to the
+    # threaded input listener when stdin is not selectable
+    # (e.g. Windows)
+    # --------------------------------------------------
+    sel = None
+    try:
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        if sel is not None:
+            sel.close()
+        sel = None
 
-            try:
-                current_mtime = os.path.getmtime(template_path)
-                if current_mtime != last_mtime:
-                    last_mtime = current_mtime
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] Template changed, re-rendering..."
-                    )
-                    render_html()
-            except FileNotFoundError:
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Warning: Template file was deleted!"
-                )
-                time.sleep(1)
-                continue
+    try:
+        if sel is not None:
+            # --------------------------------------------------
+            # event loop: with watchdog, block until a command
+            # arrives; without it, wake every 500ms to poll
+            # --------------------------------------------------
+            timeout = None if observer is not None else 0.5
+            while not quit_flag.is_set():
+                for key, _ in sel.select(timeout=timeout):
+                    if key.fileobj is sys.stdin:
+                        line = sys.stdin.readline()
+                        if not line:
+                            # stdin closed: stop watching for commands
+                            sel.unregister(sys.stdin)
+                            continue
+                        cmd = line.strip().lower()
+                        if cmd == "q":
+                            print("\nQuitting...")
+                            quit_flag.set()
+                        elif cmd == "r":
+                            print("\nRestarting server...")
+                            prompt_new_port()
+                            do_restart()
+                if observer is None:
+                    poll_template()
+        else:
+            # --------------------------------------------------
+            # threaded fallback: input listener + timed waits
+            # --------------------------------------------------
+            listener = threading.Thread(target=input_thread, daemon=True)
+            listener.start()
+            while not quit_flag.is_set():
+                quit_flag.wait(0.5)
+                if restart_flag.is_set():
+                    restart_flag.clear()
+                    do_restart()
+                    continue
+                if observer is None:
+                    poll_template()
 
     except KeyboardInterrupt:
         print("\n\nShutting down...")
 
+    if sel is not None:
+        sel.close()
+    if observer is not None:
+        observer.stop()
+        observer.join()
     if httpd:
         httpd.shutdown()
     print("Goodbye!")
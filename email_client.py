@@ -1,9 +1,17 @@
 import os
+import asyncio
 import smtplib
-from typing import List, Optional
+import threading
+from typing import Any, Iterable, List, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+# --------------------------------------------------
+# cycle the connection preventively after this many
+# messages, before the server does it for us (421 Timeout)
+# --------------------------------------------------
+MAX_MESSAGES_PER_CONNECTION = 100
+
 
 class EmailClient:
     def __init__(self, from_email: str, app_password: Optional[str] = None):
@@ -13,27 +21,171 @@ class EmailClient:
             raise ValueError(
                 "App password must be provided or set in GMAIL_APP_PASSWORD"
             )
+        # --------------------------------------------------
+        # persistent connection state: the TLS handshake +
+        # AUTH is paid once and reused across sends
+        # --------------------------------------------------
+        self._smtp: Optional[smtplib.SMTP_SSL] = None
+        self._sent_on_conn = 0
+        self._lock = threading.Lock()
 
-    def send_email(
+    def _connect(self):
+        """Opens and authenticates a fresh connection."""
+        self._smtp = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+        self._smtp.login(self.from_email, self.app_password)  # type: ignore
+        self._sent_on_conn = 0
+
+    def _close_conn(self):
+        """Closes the current connection, ignoring errors on a dead socket."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+    def _ensure_conn(self) -> smtplib.SMTP_SSL:
+        """Returns a live, authenticated connection, reconnecting if the
+        current one is dead, timed out server-side, or has served
+        `MAX_MESSAGES_PER_CONNECTION` messages."""
+        # --------------------------------------------------
+        # cycle preventively after enough messages
+        # --------------------------------------------------
+        if self._smtp is not None and self._sent_on_conn >= MAX_MESSAGES_PER_CONNECTION:
+            self._close_conn()
+        # --------------------------------------------------
+        # probe the socket; servers drop idle connections
+        # --------------------------------------------------
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] != 250:
+                    self._close_conn()
+            except (smtplib.SMTPException, OSError):
+                self._close_conn()
+        if self._smtp is None:
+            self._connect()
+        return self._smtp  # type: ignore[return-value]
+
+    def prepare(self, subject: str, body_html: str) -> MIMEMultipart:
+        """Builds the MIME message once. When the same subject/body goes to
+        several recipients, pass the result to `send_prepared` repeatedly
+        instead of rebuilding (and re-serializing) the multipart per send."""
+        msg = MIMEMultipart()
+        msg["From"] = self.from_email
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body_html, "html"))
+        return msg
+
+    def send_prepared(
         self,
-        subject: str,
-        body_html: str,
+        msg: MIMEMultipart,
         to: List[str],
         cc: List[str] = [],
         bcc: List[str] = [],
     ):
+        """Sends a message built by `prepare`, swapping only the recipient
+        headers. Uses `send_message`, which serializes the message inside
+        smtplib without an intermediate `as_string()` materialization."""
         cc = cc or []
         bcc = bcc or []
 
-        msg = MIMEMultipart()
-        msg["From"] = self.from_email
+        # --------------------------------------------------
+        # replace recipient headers in-place (the body and
+        # its serialization are untouched)
+        # --------------------------------------------------
+        del msg["To"]
+        del msg["Cc"]
         msg["To"] = ", ".join(to)
         msg["Cc"] = ", ".join(cc)
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body_html, "html"))
 
         recipients = to + cc + bcc
 
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(self.from_email, self.app_password)  # type: ignore
-            server.sendmail(self.from_email, recipients, msg.as_string())
+        with self._lock:
+            server = self._ensure_conn()
+            server.send_message(msg, self.from_email, recipients)
+            self._sent_on_conn += 1
+
+    def send_email(
+        self,
+        subject: str,
+        body_html: str,
+        to: List[str],
+        cc: List[str] = [],
+        bcc: List[str] = [],
+    ):
+        self.send_prepared(self.prepare(subject, body_html), to, cc, bcc)
+
+    def send_many(self, messages: Iterable[dict[str, Any]]):
+        """Sends several messages over one (reused) connection.
+
+        Args:
+            messages: An iterable of `send_email` keyword-argument dicts
+                (subject, body_html, to, cc, bcc).
+        """
+        for message in messages:
+            self.send_email(**message)
+
+    async def send_many_async(
+        self, messages: List[dict[str, Any]], max_concurrency: int = 5
+    ):
+        """Sends a batch of messages over a small pool of concurrent TLS
+        sessions, for high-fanout jobs where one serialized SMTP
+        conversation bottlenecks on round-trips.
+
+        Each worker opens (and authenticates) its own connection once and
+        reuses it for every message it pulls off the queue. Keep
+        `max_concurrency` modest to stay well under Gmail's concurrent
+        AUTH cap.
+
+        Args:
+            messages: A list of `send_email` keyword-argument dicts
+                (subject, body_html, to, cc, bcc).
+            max_concurrency: Size of the connection pool.
+        """
+        import aiosmtplib
+
+        # --------------------------------------------------
+        # queue of pending messages shared by the workers
+        # --------------------------------------------------
+        queue: asyncio.Queue = asyncio.Queue()
+        for message in messages:
+            queue.put_nowait(message)
+
+        async def worker():
+            # --------------------------------------------------
+            # one connection per worker, reused across messages
+            # --------------------------------------------------
+            if queue.empty():
+                return
+            smtp = aiosmtplib.SMTP(hostname="smtp.gmail.com", port=465, use_tls=True)
+            await smtp.connect()
+            try:
+                await smtp.login(self.from_email, self.app_password)  # type: ignore
+                while True:
+                    try:
+                        message = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    msg = self.prepare(message["subject"], message["body_html"])
+                    to = message["to"]
+                    cc = message.get("cc") or []
+                    bcc = message.get("bcc") or []
+                    msg["To"] = ", ".join(to)
+                    msg["Cc"] = ", ".join(cc)
+                    await smtp.send_message(
+                        msg, sender=self.from_email, recipients=to + cc + bcc
+                    )
+            finally:
+                await smtp.quit()
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+
+    def close(self):
+        with self._lock:
+            self._close_conn()
+
+    def __enter__(self) -> "EmailClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_tb: Any) -> None:
+        self.close()
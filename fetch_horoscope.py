@@ -1,14 +1,22 @@
 # --------------------------------------------------
 # external
 # --------------------------------------------------
+import re
+import os
+import json
+import atexit
+import asyncio
 import logging
 import requests
 from enum import Enum
+from pathlib import Path
+from functools import lru_cache
+from datetime import date, datetime
 from bs4 import BeautifulSoup
-from typing import List, Optional
+from typing import Any, List, Optional
 from dataclasses import dataclass
-from bs4.element import NavigableString, Tag
-from playwright.sync_api import Route, sync_playwright
+from playwright.async_api import async_playwright
+from playwright.sync_api import BrowserContext, Route, sync_playwright
 
 
 class ZodiacSign(Enum):
@@ -63,50 +71,137 @@ HOROSCOPE_CRITERIA: List[List[HoroscopeCriterion]] = [
 ]
 
 
-def _get_and_render(url: str, selector: str = "") -> BeautifulSoup:
-    # --------------------------------------------------
-    # naively makes request, without rendering
-    # --------------------------------------------------
-    # response = requests.get(url, timeout=10)
-    # response.raise_for_status()
-    # soup = BeautifulSoup(response.content, 'html.parser')
+# --------------------------------------------------
+# module-level playwright/browser/context, lazily started
+# and reused across fetches (amortizes the ~300-800ms
+# chromium startup to once per process)
+# --------------------------------------------------
+_PW: Optional[Any] = None
+_BROWSER: Optional[Any] = None
+_CTX: Optional[BrowserContext] = None
+
+
+def _shutdown():
+    """Closes the shared browser/playwright at interpreter exit."""
+    global _PW, _BROWSER, _CTX
+    if _BROWSER is not None:
+        _BROWSER.close()
+        _BROWSER = None
+        _CTX = None
+    if _PW is not None:
+        _PW.stop()
+        _PW = None
+
+
+def _get_browser() -> BrowserContext:
+    """Returns the shared browser context, starting playwright and
+    launching chromium on first use."""
+    global _PW, _BROWSER, _CTX
+    if _CTX is None:
+        _PW = sync_playwright().start()
+        _BROWSER = _PW.chromium.launch(headless=True)
+        _CTX = _BROWSER.new_context()
+        atexit.register(_shutdown)
+    return _CTX
+
+
+# --------------------------------------------------
+# junk resources to abort during rendering: match by
+# resource type where the browser reports one, plus a
+# precompiled extension regex as a catch-all
+# --------------------------------------------------
+_BLOCK_TYPES = {"image", "stylesheet", "font", "media"}
+_BLOCK_RE = re.compile(r"\.(png|jpe?g|svg|gif|css|woff2?|ico)(\?|$)", re.I)
 
+# --------------------------------------------------
+# lowercase letter at the start of the text or of a
+# sentence (some of them are lowercase in the source)
+# --------------------------------------------------
+_SENT_START = re.compile(r"(^|\. )([a-z])")
+
+
+def _should_block(request: Any) -> bool:
+    """Returns True if a page request is junk (images/styles/fonts/media)
+    which can be aborted without affecting the horoscope content."""
+    return (
+        request.resource_type in _BLOCK_TYPES
+        or _BLOCK_RE.search(request.url) is not None
+    )
+
+
+# --------------------------------------------------
+# plain-request headers: some hosts 403 the default
+# python-requests user agent
+# --------------------------------------------------
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0"
+}
+
+
+def _get_plain(url: str) -> Optional[BeautifulSoup]:
+    """Fetches a page with a plain HTTP request, without JS rendering.
+
+    This is the fast path (~20ms vs 300-800ms for headless chromium):
+    astroyogi usually ships the horoscope in the server-rendered HTML.
+
+    Args:
+        url: The URL to fetch
+
+    Returns:
+        The parsed soup, or None if the request failed
+    """
+    try:
+        response = requests.get(url, headers=_HTTP_HEADERS, timeout=10)
+        response.raise_for_status()
+        return BeautifulSoup(response.content, "lxml")
+    except requests.RequestException:
+        logging.warning("Plain HTTP fetch failed for %s", url)
+        return None
+
+
+def _get_and_render(url: str, selector: str = "") -> BeautifulSoup:
     # --------------------------------------------------
-    # makes request, with rendering
+    # makes request, with rendering. the browser context is
+    # shared across calls; only the page is per-fetch
     # --------------------------------------------------
-    with sync_playwright() as p:
-        # --------------------------------------------------
-        # open browser and page
-        # --------------------------------------------------
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
+    page = _get_browser().new_page()
+    try:
         # --------------------------------------------------
         # block junk
         # --------------------------------------------------
         def block(route: Route):
-            if any(
-                ext in route.request.url
-                for ext in [".png", ".jpg", ".svg", ".gif", ".css"]
-            ):
+            if _should_block(route.request):
                 route.abort()
             else:
                 route.continue_()
 
         page.route("**/*", block)
         # --------------------------------------------------
-        # goto url, wait for selector, get content, close browser
+        # goto url, wait for selector, get content, close page
         # --------------------------------------------------
         page.goto(url)
         page.wait_for_selector(selector)
-        html = page.content()
-        browser.close()
+        # --------------------------------------------------
+        # serialize only the matched subtree (a few KB)
+        # instead of the full page DOM (~100KB); fall back to
+        # page.content() if the handle went away
+        # --------------------------------------------------
+        html = None
+        if selector:
+            element = page.query_selector(selector)
+            if element is not None:
+                html = element.evaluate("el => el.outerHTML")
+        if html is None:
+            html = page.content()
+    finally:
+        page.close()
     # --------------------------------------------------
     # parse and return soup
     # --------------------------------------------------
-    return BeautifulSoup(html, "html.parser")
+    return BeautifulSoup(html, "lxml")
 
 
+@lru_cache(maxsize=512)
 def _string_to_birthday(birthday: str) -> tuple[int, int]:
     """
     Converts a birthday string in "YYYY-MM-DD" or "MM-DD" format to a (day, month) tuple.
@@ -117,6 +212,25 @@ def _string_to_birthday(birthday: str) -> tuple[int, int]:
     Returns:
         A tuple containing the day and month as integers
     """
+    # --------------------------------------------------
+    # canonical zero-padded forms go through strptime
+    # (C-accelerated on newer CPython); anything else
+    # (e.g. "3-5") falls through to the split path below
+    # --------------------------------------------------
+    if len(birthday) == 10:
+        try:
+            dt = datetime.strptime(birthday, "%Y-%m-%d")
+            return dt.day, dt.month
+        except ValueError:
+            pass
+    elif len(birthday) == 5:
+        try:
+            # note: defaults to year 1900, so "02-29" falls
+            # through to the split path (handled there)
+            dt = datetime.strptime(birthday, "%m-%d")
+            return dt.day, dt.month
+        except ValueError:
+            pass
     parts = birthday.split("-")
     if len(parts) == 3:
         # --------------------------------------------------
@@ -133,6 +247,29 @@ def _string_to_birthday(birthday: str) -> tuple[int, int]:
     return int(day_str), int(month_str)
 
 
+# --------------------------------------------------
+# zodiac cusp table, indexed by month (1-12): each month
+# holds at most two signs split at a known cusp day, so
+# the sign is (cusp day, sign on/before cusp, sign after)
+# --------------------------------------------------
+_ZODIAC_CUSPS: List[tuple[int, ZodiacSign, ZodiacSign]] = [
+    (0, ZodiacSign.CAPRICORN, ZodiacSign.CAPRICORN),  # unused (month 0)
+    (19, ZodiacSign.CAPRICORN, ZodiacSign.AQUARIUS),
+    (18, ZodiacSign.AQUARIUS, ZodiacSign.PISCES),
+    (20, ZodiacSign.PISCES, ZodiacSign.ARIES),
+    (19, ZodiacSign.ARIES, ZodiacSign.TAURUS),
+    (20, ZodiacSign.TAURUS, ZodiacSign.GEMINI),
+    (20, ZodiacSign.GEMINI, ZodiacSign.CANCER),
+    (22, ZodiacSign.CANCER, ZodiacSign.LEO),
+    (22, ZodiacSign.LEO, ZodiacSign.VIRGO),
+    (22, ZodiacSign.VIRGO, ZodiacSign.LIBRA),
+    (22, ZodiacSign.LIBRA, ZodiacSign.SCORPIO),
+    (21, ZodiacSign.SCORPIO, ZodiacSign.SAGITTARIUS),
+    (21, ZodiacSign.SAGITTARIUS, ZodiacSign.CAPRICORN),
+]
+
+
+@lru_cache(maxsize=512)
 def _birthday_to_zodiac_sign(day: int, month: int) -> ZodiacSign:
     """Returns Zodiac Sign, given a birthday.
 
@@ -155,36 +292,10 @@ def _birthday_to_zodiac_sign(day: int, month: int) -> ZodiacSign:
     if not 1 <= day <= days_in_month[month - 1]:
         raise ValueError("Invalid day for zodiac sign")
     # --------------------------------------------------
-    # determine zodiac by date ranges (inclusive)
-    # --------------------------------------------------
-    if (month == 12 and day >= 22) or (month == 1 and day <= 19):
-        return ZodiacSign.CAPRICORN
-    elif (month == 1 and day >= 20) or (month == 2 and day <= 18):
-        return ZodiacSign.AQUARIUS
-    elif (month == 2 and day >= 19) or (month == 3 and day <= 20):
-        return ZodiacSign.PISCES
-    elif (month == 3 and day >= 21) or (month == 4 and day <= 19):
-        return ZodiacSign.ARIES
-    elif (month == 4 and day >= 20) or (month == 5 and day <= 20):
-        return ZodiacSign.TAURUS
-    elif (month == 5 and day >= 21) or (month == 6 and day <= 20):
-        return ZodiacSign.GEMINI
-    elif (month == 6 and day >= 21) or (month == 7 and day <= 22):
-        return ZodiacSign.CANCER
-    elif (month == 7 and day >= 23) or (month == 8 and day <= 22):
-        return ZodiacSign.LEO
-    elif (month == 8 and day >= 23) or (month == 9 and day <= 22):
-        return ZodiacSign.VIRGO
-    elif (month == 9 and day >= 23) or (month == 10 and day <= 22):
-        return ZodiacSign.LIBRA
-    elif (month == 10 and day >= 23) or (month == 11 and day <= 21):
-        return ZodiacSign.SCORPIO
-    elif (month == 11 and day >= 22) or (month == 12 and day <= 21):
-        return ZodiacSign.SAGITTARIUS
-    else:
-        raise ValueError(
-            "Invalid date for zodiac sign"
-        )  # should never reach here due to validation, but just in case
+    # single table lookup + one compare against the cusp day
+    # --------------------------------------------------
+    cusp, on_or_before, after = _ZODIAC_CUSPS[month]
+    return on_or_before if day <= cusp else after
 
 
 def _apply_criteria(
@@ -229,36 +340,106 @@ def _apply_criteria(
                     else:
                         expanded.extend(el.find_all(criterion.tag))
                 elements = expanded
-            for element in elements:
-                # --------------------------------------------------
-                # init text, search for in element
-                # --------------------------------------------------
-                text = None
-                for child in element.contents:
-                    if isinstance(child, NavigableString):
-                        _text = child.strip()
-                        if _text:
-                            text = _text
-                            break
-                    elif isinstance(child, Tag):
-                        _text = child.get_text(strip=True)
-                        if _text:
-                            text = _text
-                            break
-                # --------------------------------------------------
-                # if not found, continue to next element
-                # --------------------------------------------------
-                if not text:
-                    continue
-                if criterion.text_prefixes:
-                    if any(text.startswith(p) for p in criterion.text_prefixes):
-                        return text
-                else:
-                    return text
-            return None
+            # --------------------------------------------------
+            # one get_text traversal per element (instead of a
+            # python-level walk over contents with isinstance
+            # dispatch), short-circuiting on the first match
+            # --------------------------------------------------
+            # " " separator keeps words apart around inline tags
+            # (links, <em>); identical for plain-text paragraphs
+            texts = (element.get_text(" ", strip=True) for element in elements)
+            if criterion.text_prefixes:
+                prefixes = tuple(criterion.text_prefixes)
+                return next((t for t in texts if t and t.startswith(prefixes)), None)
+            return next((t for t in texts if t), None)
     return None
 
 
+# --------------------------------------------------
+# on-disk daily cache: horoscopes only change once per
+# day, so repeated runs for the same sign read a JSON
+# file instead of re-fetching/rendering
+# --------------------------------------------------
+_CACHE_PATH = Path("~/.cache/budget-reminder/horoscopes.json").expanduser()
+
+
+def _cache_key(sign: ZodiacSign) -> str:
+    return f"{sign.value}:{date.today().isoformat()}"
+
+
+def _cache_load() -> dict[str, List[str]]:
+    """Loads the cache file, returning an empty cache on any problem."""
+    try:
+        return json.loads(_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _cache_get(sign: ZodiacSign) -> Optional[tuple[str, str]]:
+    """Returns today's cached (text, url) for a sign, or None on a miss."""
+    entry = _cache_load().get(_cache_key(sign))
+    if entry:
+        return entry[0], entry[1]
+    return None
+
+
+def _cache_put(sign: ZodiacSign, text: str, url: str):
+    """Stores today's (text, url) for a sign, dropping stale days."""
+    today_suffix = ":" + date.today().isoformat()
+    cache = {k: v for k, v in _cache_load().items() if k.endswith(today_suffix)}
+    cache[_cache_key(sign)] = [text, url]
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_PATH.with_suffix(_CACHE_PATH.suffix + ".tmp")
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        logging.warning("Could not write horoscope cache to %s", _CACHE_PATH)
+
+
+def _sign_url(sign: ZodiacSign) -> str:
+    """Returns the astroyogi daily-horoscope URL for a zodiac sign."""
+    return f"https://www.astroyogi.com/horoscopes/daily/{sign.value.lower()}-free-horoscope.aspx"
+
+
+def _parse_horoscope_soup(soup: BeautifulSoup) -> Optional[str]:
+    """Extracts and cleans the horoscope text from a rendered page soup.
+
+    Args:
+        soup: The rendered page as BeautifulSoup
+
+    Returns:
+        The cleaned horoscope text, or None if no criteria matched
+    """
+    # --------------------------------------------------
+    # try each criteria list in order, use the first match
+    # --------------------------------------------------
+    first_child_text = None
+    for criteria_list in HOROSCOPE_CRITERIA:
+        result = _apply_criteria(soup, criteria_list)
+        if result is not None:
+            first_child_text = result
+            break
+    # --------------------------------------------------
+    # return None if not found (callers decide whether this
+    # warrants a log, since the plain-HTTP fast path falls
+    # back to rendering on a miss)
+    # --------------------------------------------------
+    if not first_child_text:
+        return None
+    # --------------------------------------------------
+    # find and replace "Astroyogi a" with "a"
+    # --------------------------------------------------
+    first_child_text = first_child_text.replace("Astroyogi a", "a")
+    # --------------------------------------------------
+    # ensure all sentence beginnings start with a capital
+    # letter, in a single regex pass
+    # --------------------------------------------------
+    return _SENT_START.sub(
+        lambda m: m.group(1) + m.group(2).upper(), first_child_text
+    )
+
+
 def _horoscope_request(sign: ZodiacSign) -> Optional[tuple[str, str]]:
     """
     Fetch horoscope content for a zodiac sign. Uses `astroyogi.com`.
@@ -269,24 +450,27 @@ def _horoscope_request(sign: ZodiacSign) -> Optional[tuple[str, str]]:
     Returns:
         Optional[tuple[str, str]]: The extracted horoscope text and URL, or None if not found
     """
-    url = f"https://www.astroyogi.com/horoscopes/daily/{sign.value.lower()}-free-horoscope.aspx"
+    # --------------------------------------------------
+    # check today's on-disk cache first
+    # --------------------------------------------------
+    cached = _cache_get(sign)
+    if cached is not None:
+        return cached
+    url = _sign_url(sign)
     try:
         # --------------------------------------------------
-        # make request
+        # fast path: plain HTTP fetch, no browser
         # --------------------------------------------------
-        selector = "div.content-page"
-        soup = _get_and_render(
-            url, selector
-        )  # render the page with playwright to get dynamic content
+        soup = _get_plain(url)
+        first_child_text = _parse_horoscope_soup(soup) if soup is not None else None
         # --------------------------------------------------
-        # try each criteria list in order, use the first match
+        # fallback: render the page with playwright to get
+        # dynamic content
         # --------------------------------------------------
-        first_child_text = None
-        for criteria_list in HOROSCOPE_CRITERIA:
-            result = _apply_criteria(soup, criteria_list)
-            if result is not None:
-                first_child_text = result
-                break
+        if not first_child_text:
+            selector = "div.content-page"
+            soup = _get_and_render(url, selector)
+            first_child_text = _parse_horoscope_soup(soup)
         # --------------------------------------------------
         # return None if not found
         # --------------------------------------------------
@@ -296,19 +480,9 @@ def _horoscope_request(sign: ZodiacSign) -> Optional[tuple[str, str]]:
             )
             return None
         # --------------------------------------------------
-        # find and replace "Astroyogi a" with "a"
-        # --------------------------------------------------
-        first_child_text = first_child_text.replace("Astroyogi a", "a")
-        # --------------------------------------------------
-        # ensure all sentence beginnings start with a capital
-        # letters (some of them are lowercase in the source)
-        # --------------------------------------------------
-        sentences = first_child_text.split(". ")
-        sentences = [s[:1].upper() + s[1:] if s else s for s in sentences]
-        first_child_text = ". ".join(sentences)
-        # --------------------------------------------------
-        # return the horoscope text and URL
+        # cache and return the horoscope text and URL
         # --------------------------------------------------
+        _cache_put(sign, first_child_text, url)
         return first_child_text, url
 
     # --------------------------------------------------
@@ -322,6 +496,128 @@ def _horoscope_request(sign: ZodiacSign) -> Optional[tuple[str, str]]:
         return None
 
 
+async def _horoscope_request_async(
+    ctx: Any, sign: ZodiacSign
+) -> Optional[tuple[str, str]]:
+    """
+    Async variant of `_horoscope_request`, fetching over a shared
+    async browser context so multiple signs render concurrently.
+
+    Args:
+        ctx: A `playwright.async_api.BrowserContext` to open the page in
+        sign: The zodiac sign to fetch
+
+    Returns:
+        Optional[tuple[str, str]]: The extracted horoscope text and URL, or None if not found
+    """
+    # --------------------------------------------------
+    # check today's on-disk cache first
+    # --------------------------------------------------
+    cached = _cache_get(sign)
+    if cached is not None:
+        return cached
+    url = _sign_url(sign)
+    try:
+        page = await ctx.new_page()
+        try:
+            # --------------------------------------------------
+            # block junk
+            # --------------------------------------------------
+            async def block(route: Any):
+                if _should_block(route.request):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await page.route("**/*", block)
+            # --------------------------------------------------
+            # goto url, wait for selector, get content, close page
+            # --------------------------------------------------
+            await page.goto(url)
+            await page.wait_for_selector("div.content-page")
+            html = await page.content()
+        finally:
+            await page.close()
+        # --------------------------------------------------
+        # parse and extract
+        # --------------------------------------------------
+        first_child_text = _parse_horoscope_soup(BeautifulSoup(html, "lxml"))
+        if not first_child_text:
+            logging.error(
+                "Could not find horoscope paragraph matching any criteria in the content div"
+            )
+            return None
+        _cache_put(sign, first_child_text, url)
+        return first_child_text, url
+    except Exception:
+        logging.exception("Error fetching horoscope for %s", sign.value)
+        return None
+
+
+async def get_horoscopes_for_birthdays(
+    birthdays: List[str],
+) -> List[Optional[tuple[str, str]]]:
+    """
+    Get horoscope texts for several birthdays concurrently, sharing a
+    single async browser so N fetches cost ~max() instead of sum().
+
+    Args:
+        birthdays: Birthday strings in "YYYY-MM-DD" or "MM-DD" format
+
+    Returns:
+        One optional (text, url) tuple per birthday, in input order
+    """
+    # --------------------------------------------------
+    # resolve birthdays to signs (None for unparseable ones),
+    # dedupe so each sign is fetched at most once
+    # --------------------------------------------------
+    signs: List[Optional[ZodiacSign]] = []
+    for birthday in birthdays:
+        try:
+            day, month = _string_to_birthday(birthday)
+            signs.append(_birthday_to_zodiac_sign(day, month))
+        except ValueError:
+            logging.exception("Error processing birthday input: %s", birthday)
+            signs.append(None)
+    unique_signs = list({sign for sign in signs if sign is not None})
+    if not unique_signs:
+        return [None] * len(birthdays)
+    # --------------------------------------------------
+    # fetch all unique signs concurrently over one browser
+    # --------------------------------------------------
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        ctx = await browser.new_context()
+        try:
+            results = await asyncio.gather(
+                *[_horoscope_request_async(ctx, sign) for sign in unique_signs]
+            )
+        finally:
+            await browser.close()
+    # --------------------------------------------------
+    # map results back to input order
+    # --------------------------------------------------
+    sign2result = dict(zip(unique_signs, results))
+    return [sign2result.get(sign) if sign else None for sign in signs]
+
+
+async def prefetch_all_horoscopes():
+    """
+    Fetches all 12 signs concurrently and populates today's on-disk
+    cache. Meant for a daily cron job, turning subsequent per-sign
+    reads into sub-millisecond JSON lookups.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        ctx = await browser.new_context()
+        try:
+            await asyncio.gather(
+                *[_horoscope_request_async(ctx, sign) for sign in ZodiacSign]
+            )
+        finally:
+            await browser.close()
+
+
 def get_horoscope_for_birthday(birthday: str) -> Optional[tuple[str, str]]:
     """
     Get the horoscope text for a given birthday.
@@ -1,19 +1,65 @@
 # --------------------------------------------------
 # external
 # --------------------------------------------------
+import math
 from enum import Enum
-from typing import List, Optional
+from operator import attrgetter, itemgetter
+from typing import Iterable, List, Optional
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from jinja2 import Environment, FileSystemLoader
+from pathlib import Path
+from datetime import date
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 # --------------------------------------------------
 # local
 # --------------------------------------------------
-from helpers import parse_money
+from helpers import parse_mdy, parse_money, parse_money_column
+
+# --------------------------------------------------
+# persist compiled template bytecode between runs: this
+# script is usually a fresh interpreter per run (cron), so
+# the in-process cache alone never gets a second hit. the
+# cache invalidates itself when the template changes. if
+# the directory can't be created (read-only home, full
+# disk), skip the bytecode cache rather than failing the
+# import -- it is a pure optimization
+# --------------------------------------------------
+_JINJA_CACHE_DIR = Path("~/.cache/budget-reminder/jinja").expanduser()
+try:
+    _JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _JINJA_BYTECODE_CACHE = FileSystemBytecodeCache(
+        directory=str(_JINJA_CACHE_DIR), pattern="%s.cache"
+    )
+except OSError:
+    _JINJA_BYTECODE_CACHE = None
+
+# --------------------------------------------------
+# module-level environment + loader: template parse/compile
+# is paid once per process instead of per render, and a
+# forked worker pool would inherit the compiled-template
+# cache copy-on-write instead of recompiling per worker.
+# auto_reload is off so repeated get_template calls are a
+# pure dict hit with no stat syscall -- debug mode, which
+# edits templates live, calls invalidate_template_cache()
+# instead
+# --------------------------------------------------
+_JINJA_LOADER = FileSystemLoader(".")
+_JINJA_ENV = Environment(
+    loader=_JINJA_LOADER,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=_JINJA_BYTECODE_CACHE,
+)
 
 
-@dataclass
+def invalidate_template_cache():
+    """Drops the compiled-template cache so the next `get_template` re-reads
+    from disk. Only needed when a template changes mid-process (debug mode);
+    the normal send path never calls this."""
+    _JINJA_ENV.cache.clear()
+
+
+@dataclass(slots=True)
 class BudgetMetadata:
     name: str
     spreadsheet_url: str
@@ -31,13 +77,18 @@ class ExpenseType(Enum):
         return self.name
 
     def description(self):
-        match self:
-            case ExpenseType.Expendable:
-                return "`Expendable` expenses are those which are used daily, without any committed savings or bills. For example, groceries, entertainment, transportation, etc."
-            case ExpenseType.Saving:
-                return "`Saving` expenses are those which must not be spent, since they are being saved for future use. For example, dates, vacations, investments, etc."
-            case ExpenseType.RequiredPayment:
-                return "`Required Payment` expenses are those which must be paid each month. For example, rent/bills, insurance, credit card payments, student loans, etc."
+        return _EXPENSE_DESCRIPTIONS[self]
+
+
+# --------------------------------------------------
+# description strings resolved by a single dict lookup
+# (description() can run once per row during a render)
+# --------------------------------------------------
+_EXPENSE_DESCRIPTIONS = {
+    ExpenseType.Expendable: "`Expendable` expenses are those which are used daily, without any committed savings or bills. For example, groceries, entertainment, transportation, etc.",
+    ExpenseType.Saving: "`Saving` expenses are those which must not be spent, since they are being saved for future use. For example, dates, vacations, investments, etc.",
+    ExpenseType.RequiredPayment: "`Required Payment` expenses are those which must be paid each month. For example, rent/bills, insurance, credit card payments, student loans, etc.",
+}
 
 
 class BssCategory(Enum):
@@ -46,71 +97,63 @@ class BssCategory(Enum):
     Savings = 3
 
 
-@dataclass
-class BssSpent:
-    category: BssCategory
-    amount: float
+@dataclass(slots=True)
+class Bss:
+    # --------------------------------------------------
+    # only the per-category totals are ever consumed, so
+    # from_rows accumulates them directly instead of building
+    # (and re-scanning) a list of per-entry objects
+    # --------------------------------------------------
+    totals: dict[BssCategory, float]
 
     @classmethod
-    def from_rows(cls, rows: List[List[str]]) -> List["BssSpent"]:
-        result: List["BssSpent"] = []
+    def from_rows(cls, cells: List[str]) -> "Bss":
+        # --------------------------------------------------
+        # takes the already-flattened single column; strip
+        # once, then gather (label, amount-cell) pairs: a
+        # non-empty label is followed by its amount cell
+        # --------------------------------------------------
+        cells = [cell.strip() for cell in cells]
+        labels: List[str] = []
+        amount_cells: List[str] = []
         i = 0
-        while i < len(rows):
-            # --------------------------------------------------
-            # skip empty rows
-            # --------------------------------------------------
-            if not rows[i] or not rows[i][0].strip():
+        while i < len(cells):
+            label = cells[i]
+            if not label:
                 i += 1
                 continue
-            # --------------------------------------------------
-            # get category
-            # --------------------------------------------------
-            category_str = rows[i][0].strip().lower()
-            if "bill" in category_str:
+            labels.append(label.lower())
+            amount_cells.append(cells[i + 1] if i + 1 < len(cells) else "")
+            i += 2
+        # --------------------------------------------------
+        # batch-parse the amounts, then accumulate per label
+        # --------------------------------------------------
+        amounts = parse_money_column(amount_cells)
+        totals = {category: 0.0 for category in BssCategory}
+        for label, amount in zip(labels, amounts):
+            if "bill" in label:
                 category = BssCategory.Bills
-            elif "sav" in category_str:
+            elif "sav" in label:
                 category = BssCategory.Savings
             else:
                 category = BssCategory.Spending
-            # --------------------------------------------------
-            # get amount
-            # --------------------------------------------------
-            amount = 0.0
-            if i + 1 < len(rows):
-                amount = parse_money(rows[i + 1][0])
-            i += 2
-            result.append(cls(category=category, amount=amount))
-        return result
-
-
-@dataclass
-class Bss:
-    elements: List[BssSpent]
-
-    @classmethod
-    def from_rows(cls, rows: List[List[str]]) -> "Bss":
-        return cls(elements=BssSpent.from_rows(rows))
+            totals[category] += amount
+        return cls(totals=totals)
 
     def spending(self) -> float:
-        return sum(
-            bss.amount for bss in self.elements if bss.category == BssCategory.Spending
-        )
+        return self.totals[BssCategory.Spending]
 
     def bills(self) -> float:
-        return sum(
-            bss.amount for bss in self.elements if bss.category == BssCategory.Bills
-        )
+        return self.totals[BssCategory.Bills]
 
     def savings(self) -> float:
-        return sum(
-            bss.amount for bss in self.elements if bss.category == BssCategory.Savings
-        )
+        return self.totals[BssCategory.Savings]
 
     def total(self) -> float:
-        return sum(bss.amount for bss in self.elements)
+        return sum(self.totals.values())
 
 
-@dataclass
+@dataclass(slots=True)
 # --------------------------------------------------
 # this is found in "Payments" column of `Budgeting` sheet,
 # where an overview of general payments w.r.t. categories
@@ -138,13 +181,15 @@ class PaymentsOverview:
     # column 1: amount (payments)
     # column 2: amount (savings)
     # ...
-    def from_range(cls, rows: List[List[str]]) -> List["PaymentsOverview"]:
-        return [
-            r for row in rows for r in [PaymentsOverview.from_row(row)] if r is not None
-        ]
+    def from_range(cls, rows: Iterable[List[str]]) -> List["PaymentsOverview"]:
+        # --------------------------------------------------
+        # one streaming pass: each row is parsed and released
+        # without the full range being re-walked
+        # --------------------------------------------------
+        return [o for row in rows if (o := cls.from_row(row)) is not None]
 
 
-@dataclass
+@dataclass(slots=True)
 # --------------------------------------------------
 # this is found in "To Save" column of `Budgeting` sheet,
 # where an overview of general payments w.r.t. categories
@@ -172,13 +217,15 @@ class SavingsOverview:
     # column 1: amount (payments)
     # column 2: amount (savings)
     # ...
-    def from_range(cls, rows: List[List[str]]) -> List["SavingsOverview"]:
-        return [
-            r for row in rows for r in [SavingsOverview.from_row(row)] if r is not None
-        ]
+    def from_range(cls, rows: Iterable[List[str]]) -> List["SavingsOverview"]:
+        # --------------------------------------------------
+        # one streaming pass: each row is parsed and released
+        # without the full range being re-walked
+        # --------------------------------------------------
+        return [o for row in rows if (o := cls.from_row(row)) is not None]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpendableOverview:
     category: str
     spendable_amount: float
@@ -206,11 +253,11 @@ class SpendableOverview:
     # column 1: spendable amount
     # column 2: future daily
     # column 3: left today
-    def from_range(cls, rows: List[List[str]]) -> List["SpendableOverview"]:
+    def from_range(cls, rows: Iterable[List[str]]) -> List["SpendableOverview"]:
         return [SpendableOverview.from_row(row) for row in rows]
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferOverview:
     from_account: str
     to_account: str
@@ -234,13 +281,15 @@ class TransferOverview:
     # column 0: from account
     # column 1: to account
     # column 2: amount
-    def from_range(cls, rows: List[List[str]]) -> List["TransferOverview"]:
-        return [
-            r for row in rows for r in [TransferOverview.from_row(row)] if r is not None
-        ]
+    def from_range(cls, rows: Iterable[List[str]]) -> List["TransferOverview"]:
+        # --------------------------------------------------
+        # one streaming pass: each row is parsed and released
+        # without the full range being re-walked
+        # --------------------------------------------------
+        return [o for row in rows if (o := cls.from_row(row)) is not None]
 
 
-@dataclass
+@dataclass(slots=True)
 class Budget:
     category: str
     subcategory: Optional[str]
@@ -257,16 +306,17 @@ class Budget:
     # column 2: description
     # column 3: is per-day expendable?
     def from_manual_budget_row(cls, period_size: float, row: List[str]) -> "Budget":
-        category = row[0].strip()
-        detailed_description = row[2].strip()
+        category = row[0]
+        detailed_description = row[2]
         description = (category, category + " / " + detailed_description)[
             bool(detailed_description)
         ]
-        match str(row[3]):  # Is Per-Day Expendable?
-            case "FALSE":
-                expense_type = ExpenseType.RequiredPayment
-            case _:
-                expense_type = ExpenseType.Expendable
+        # Is Per-Day Expendable?
+        expense_type = (
+            ExpenseType.RequiredPayment
+            if row[3] == "FALSE"
+            else ExpenseType.Expendable
+        )
         return cls(
             category=category,
             subcategory=None,
@@ -284,9 +334,16 @@ class Budget:
     # column 2: description
     # column 3: is per-day expendable?
     def from_manual_budget_range(
-        cls, period_size: float, rows: List[List[str]]
+        cls, period_size: float, rows: Iterable[List[str]]
     ) -> List["Budget"]:
-        return [cls.from_manual_budget_row(period_size, row) for row in rows]
+        # --------------------------------------------------
+        # strip every cell once at entry; the row parser then
+        # indexes clean cells without per-field strips
+        # --------------------------------------------------
+        return [
+            cls.from_manual_budget_row(period_size, [c.strip() for c in row])
+            for row in rows
+        ]
 
     @classmethod
     # column 0: subcategory
@@ -298,24 +355,19 @@ class Budget:
     # column 6 (unused): adjusted start date
     # column 7: next approx payment date
     def from_recurring_budget_row(
-        cls, cat2subcat: dict[str, List[str]], row: List[str]
+        cls, sub2cat: dict[str, str], row: List[str]
     ) -> "Budget":
-        subcategory = row[0].strip()
-        description = row[1].strip()
+        subcategory = row[0]
+        description = row[1]
         amount = parse_money(row[2])
         timeframe = float(row[3])
-        match str(row[4]):  # Is Saving?
-            case "FALSE":
-                expense_type = ExpenseType.RequiredPayment
-            case _:
-                expense_type = ExpenseType.Saving
-        paid_from = row[5].strip()
-        next_approx_payment = datetime.strptime(row[7].strip(), "%m/%d/%Y").date()
-        category = None
-        for cat in cat2subcat:
-            if subcategory in cat2subcat[cat]:
-                category = cat
-                break
+        # Is Saving?
+        expense_type = (
+            ExpenseType.RequiredPayment if row[4] == "FALSE" else ExpenseType.Saving
+        )
+        paid_from = row[5]
+        next_approx_payment = parse_mdy(row[7])
+        category = sub2cat.get(subcategory)
         if not category:
             raise Exception(
                 f"Could not find category for subcategory {subcategory}, this is impossible."
@@ -341,12 +393,24 @@ class Budget:
     # column 6 (unused): adjusted start date
     # column 7: next approx payment date
     def from_recurring_budget_range(
-        cls, cat2subcat: dict[str, List[str]], rows: List[List[str]]
+        cls, cat2subcat: dict[str, List[str]], rows: Iterable[List[str]]
     ) -> List["Budget"]:
-        return [cls.from_recurring_budget_row(cat2subcat, row) for row in rows]
+        # --------------------------------------------------
+        # invert the mapping once; per-row lookups become a
+        # single dict hit instead of scanning every category
+        # --------------------------------------------------
+        sub2cat = {sub: cat for cat, subs in cat2subcat.items() for sub in subs}
+        # --------------------------------------------------
+        # strip every cell once at entry; the row parser then
+        # indexes clean cells without per-field strips
+        # --------------------------------------------------
+        return [
+            cls.from_recurring_budget_row(sub2cat, [c.strip() for c in row])
+            for row in rows
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountBalance:
     name: str
     amount_manual: float
@@ -358,7 +422,7 @@ class AccountBalance:
     # column 1: amount @ start
     # column 2: amount (calc.)
     # column 3: amount (actual / manual)
-    def from_rows(cls, rows: List[List[str]]) -> List["AccountBalance"]:
+    def from_rows(cls, rows: Iterable[List[str]]) -> List["AccountBalance"]:
         result: List["AccountBalance"] = []
         for row in rows:
             name = row[0].strip()
@@ -376,7 +440,7 @@ class AccountBalance:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetStats:
     # --------------------------------------------------
     # income account (name of account where income is received, e.g. "Checking")
@@ -467,28 +531,37 @@ class BudgetStats:
     free_to_spend: float
 
     @classmethod
-    def from_rows(cls, rows: List[List[str]]) -> "BudgetStats":
+    def from_rows(cls, cells: List[str]) -> "BudgetStats":
+        # --------------------------------------------------
+        # takes the already-flattened stats column; strip
+        # once, then gather the 13 money cells (every other
+        # row) and parse them in one batch pass
+        # --------------------------------------------------
+        cells = [cell.strip() for cell in cells]
+        money = parse_money_column(
+            [cells[i] for i in (3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 29, 31)]
+        )
         return cls(
-            income_account=rows[0][0].strip(),
-            total_budget=parse_money(rows[3][0]),
-            income_at_period_start=parse_money(rows[5][0]),
-            checking_amount_period_start=parse_money(rows[7][0]),
-            total_withheld_required_payments=parse_money(rows[9][0]),
-            total_withheld_savings=parse_money(rows[11][0]),
-            balance_after_withheld=parse_money(rows[13][0]),
-            budget_after_withheld=parse_money(rows[15][0]),
-            allocated_spending_budget=parse_money(rows[17][0]),
-            balance_after_withheld_and_spending=parse_money(rows[19][0]),
-            budget_after_withheld_and_spending=parse_money(rows[21][0]),
-            budget_after_withheld_and_spent=parse_money(rows[23][0]),
-            overspent_soft=rows[25][0].strip().upper() == "TRUE",
-            overspent_hard=rows[27][0].strip().upper() == "TRUE",
-            checking_floor=parse_money(rows[29][0]),
-            free_to_spend=parse_money(rows[31][0]),
+            income_account=cells[0],
+            total_budget=money[0],
+            income_at_period_start=money[1],
+            checking_amount_period_start=money[2],
+            total_withheld_required_payments=money[3],
+            total_withheld_savings=money[4],
+            balance_after_withheld=money[5],
+            budget_after_withheld=money[6],
+            allocated_spending_budget=money[7],
+            balance_after_withheld_and_spending=money[8],
+            budget_after_withheld_and_spending=money[9],
+            budget_after_withheld_and_spent=money[10],
+            overspent_soft=cells[25].upper() == "TRUE",
+            overspent_hard=cells[27].upper() == "TRUE",
+            checking_floor=money[11],
+            free_to_spend=money[12],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     meta: BudgetMetadata
 
@@ -512,45 +585,116 @@ class Summary:
     custom_alert: Optional[str] = None
 
     def to_email_html(self, template_path: str = "budget-email.html") -> str:
-        env = Environment(loader=FileSystemLoader("."))
-        template = env.get_template(template_path)
-        today = date.today() + timedelta(
-            0
-        )  # dont know if this is actually required, but works?
+        template = _JINJA_ENV.get_template(template_path)
+        today = date.today()
         days_left = max((self.end_date - today).days, 0) + 1
-        remaining_sum = sum([s.spendable_amount for s in self.spendable_overviews])
         # --------------------------------------------------
-        # calculate overflow percentage based on how much of
-        # the overflow pool has been consumed by overspending
+        # fsum: no intermediate list, and compensated
+        # summation keeps money totals exact
         # --------------------------------------------------
-        bills_this_period = self.spent_categorized.bills()
-        savings_this_period = self.spent_categorized.savings()
-        spending_this_period = self.spent_categorized.spending()
-        bills_overspent = max(
-            0, bills_this_period - self.budget_stats.total_withheld_required_payments
-        )
-        savings_overspent = max(
-            0, savings_this_period - self.budget_stats.total_withheld_savings
+        remaining_sum = math.fsum(
+            s.spendable_amount for s in self.spendable_overviews
         )
-        spending_overspent = max(
-            0, spending_this_period - self.budget_stats.allocated_spending_budget
-        )
-        overflow_consumed = bills_overspent + savings_overspent + spending_overspent
+        # --------------------------------------------------
+        # calculate overflow percentage based on how much of
+        # the overflow pool has been consumed by overspending.
+        # nothing spent yet means nothing overspent, so skip
+        # the arithmetic entirely
+        # --------------------------------------------------
         overflow_available = self.budget_stats.budget_after_withheld_and_spending
-        overflow_pct = (
-            (overflow_consumed / overflow_available * 100)
-            if overflow_available > 0
-            else 0
-        )
-        overflow_pct = max(overflow_pct, 0)
+        if any(self.spent_categorized.totals.values()):
+            bills_this_period = self.spent_categorized.bills()
+            savings_this_period = self.spent_categorized.savings()
+            spending_this_period = self.spent_categorized.spending()
+            bills_overspent = max(
+                0,
+                bills_this_period
+                - self.budget_stats.total_withheld_required_payments,
+            )
+            savings_overspent = max(
+                0, savings_this_period - self.budget_stats.total_withheld_savings
+            )
+            spending_overspent = max(
+                0, spending_this_period - self.budget_stats.allocated_spending_budget
+            )
+            overflow_consumed = bills_overspent + savings_overspent + spending_overspent
+            overflow_pct = (
+                (overflow_consumed / overflow_available * 100)
+                if overflow_available > 0
+                else 0
+            )
+            overflow_pct = max(overflow_pct, 0)
+        else:
+            bills_this_period = savings_this_period = spending_this_period = 0.0
+            overflow_consumed = 0.0
+            overflow_pct = 0
 
         # --------------------------------------------------
         # sort spendable overviews by left_today descending
         # --------------------------------------------------
         spendable_overviews_sorted = sorted(
-            self.spendable_overviews, key=lambda x: x.left_today, reverse=True
+            self.spendable_overviews, key=attrgetter("left_today"), reverse=True
         )
 
+        # --------------------------------------------------
+        # precompute the template's derived views here: jinja
+        # otherwise rebuilds them with per-row getattr/format
+        # calls inside its interpreter loop. the committed
+        # (bill/saving) budgets with their per-period amounts
+        # feed both views
+        # --------------------------------------------------
+        today_ord = today.toordinal()
+        committed = [
+            (b, (b.amount / b.timeframe) * self.period_size)
+            for b in self.budgets
+            if b.expense_type in (ExpenseType.RequiredPayment, ExpenseType.Saving)
+        ]
+
+        # --------------------------------------------------
+        # items due within the next 5 days, pre-formatted
+        # --------------------------------------------------
+        due_soon_items = []
+        for b, amt in committed:
+            if amt == 0 or b.next_approx_payment is None:
+                continue
+            days_until_due = b.next_approx_payment.toordinal() - today_ord
+            if 0 <= days_until_due <= 5:
+                due_soon_items.append(
+                    {
+                        "due_label": (
+                            "Today"
+                            if days_until_due == 0
+                            else "Tomorrow"
+                            if days_until_due == 1
+                            else b.next_approx_payment.strftime("%A, %b %d")
+                        ),
+                        "is_urgent": days_until_due <= 1,
+                        "is_bill": b.expense_type is ExpenseType.RequiredPayment,
+                        "item": f"{b.subcategory or b.category} // {b.description}",
+                        "amount": f"{b.amount:,.2f}",
+                    }
+                )
+
+        # --------------------------------------------------
+        # per-transfer breakdown of what the moved money
+        # covers, sorted largest-first and pre-formatted
+        # --------------------------------------------------
+        transfer_breakdowns = []
+        for t in self.transfer_overviews:
+            items = [
+                {
+                    "description": b.description,
+                    "amount": amt,
+                    "is_bill": b.expense_type is ExpenseType.RequiredPayment,
+                }
+                for b, amt in committed
+                if b.paid_from == t.to_account and amt > 0
+            ]
+            items.sort(key=itemgetter("amount"), reverse=True)
+            for item in items:
+                item["amount"] = f"{item['amount']:,.2f}"
+            transfer_breakdowns.append(items)
+
         # --------------------------------------------------
         # render
         # --------------------------------------------------
@@ -572,6 +716,8 @@ class Summary:
             budgets=self.budgets,
             budget_stats=self.budget_stats,
             transfer_overviews=self.transfer_overviews,
+            due_soon_items=due_soon_items,
+            transfer_breakdowns=transfer_breakdowns,
             time=self.time,
             horoscope=self.horoscope,
             horoscope_url=self.horoscope_url,
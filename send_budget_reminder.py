@@ -1,39 +1,139 @@
 # --------------------------------------------------
 # external
 # --------------------------------------------------
+import os
 import sys
-import toml
+import time
+import sched
+import pickle
+import hashlib
 import logging
 import argparse
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Any, Optional, List
-from google.oauth2 import service_account
-from googleapiclient.discovery import build  # type: ignore
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, List
 
 # --------------------------------------------------
 # local
 # --------------------------------------------------
 import primitives
 import email_client
-from helpers import LogTimer
+from helpers import LogTimer, parse_mdy
 from debug_server import debug_mode
 from fetch_horoscope import get_horoscope_for_birthday
 
 # --------------------------------------------------
-# configure logging
+# logging defaults; configured in main() once the log file
+# is known, so the default file is never opened just to be
+# closed and replaced
 # --------------------------------------------------
 DEFAULT_LOG_LEVEL = logging.INFO
 DEFAULT_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 DEFAULT_LOG_FILE = "history.log"
-logging.basicConfig(
-    level=DEFAULT_LOG_LEVEL,
-    format=DEFAULT_LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(DEFAULT_LOG_FILE, mode="a"),  # always append
-    ],
-)
+
+# --------------------------------------------------
+# cache dir shared with the horoscope / jinja caches
+# --------------------------------------------------
+_CACHE_DIR = Path("~/.cache/budget-reminder").expanduser()
+
+
+def _load_cfg(path: Path) -> dict[str, Any]:
+    """Parses the TOML configuration, caching the parsed dict as a pickle
+    keyed by the file's mtime and size so repeated cron runs skip the
+    parse entirely. Any unreadable/stale cache falls through to a fresh
+    parse."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    name = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    cache_file = _CACHE_DIR / f"cfg.{name}.pkl"
+    try:
+        cached_key, cfg = pickle.loads(cache_file.read_bytes())
+        if cached_key == key:
+            return cfg
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+    # --------------------------------------------------
+    # stdlib tomllib parses raw bytes (no intermediate
+    # str decode) and is much faster than the pure-python
+    # toml package. imported here so cache hits never pay
+    # for it
+    # --------------------------------------------------
+    import tomllib
+
+    with path.open("rb") as f:
+        cfg = tomllib.load(f)
+    # --------------------------------------------------
+    # atomic write so a concurrent run never reads a
+    # half-written pickle; a failed write (read-only home,
+    # full disk) just means no cache, never a failed run
+    # --------------------------------------------------
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".pkl.tmp")
+        tmp.write_bytes(pickle.dumps((key, cfg), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache_file)
+    except (OSError, pickle.PickleError):
+        logging.debug("could not cache parsed configuration", exc_info=True)
+    return cfg
+
+
+def _flatten_column(rows: List[List[str]]) -> List[str]:
+    """Flattens a single-column range ([["a"], [], ["b"]]) into a flat cell
+    list, empty rows becoming ""."""
+    return [row[0] if row else "" for row in rows]
+
+
+def _load_credentials(path: str) -> Any:
+    """Builds the read-only Sheets credentials from a service-account file,
+    caching the constructed object as a pickle keyed by the file's mtime and
+    size so repeated runs skip the JSON parse and RSA key construction. Any
+    unreadable/stale cache falls through to a fresh build."""
+    key_path = Path(path)
+    st = key_path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    name = hashlib.blake2b(str(key_path.resolve()).encode(), digest_size=8).hexdigest()
+    cache_file = _CACHE_DIR / f"creds.{name}.pkl"
+    try:
+        cached_key, creds = pickle.loads(cache_file.read_bytes())
+        if cached_key == key:
+            return creds
+    except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError):
+        pass
+    from google.oauth2 import service_account
+
+    # --------------------------------------------------
+    # parse the key JSON ourselves with orjson (C-level,
+    # several times faster than the stdlib json that
+    # from_service_account_file goes through), falling
+    # back to stdlib json when orjson is not installed
+    # --------------------------------------------------
+    try:
+        import orjson
+
+        info = orjson.loads(key_path.read_bytes())
+    except ImportError:
+        import json
+
+        info = json.loads(key_path.read_bytes())
+    creds = service_account.Credentials.from_service_account_info(  # type: ignore
+        info,
+        scopes=["https://www.googleapis.com/auth/spreadsheets.readonly"],
+    )
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".pkl.tmp")
+        tmp.write_bytes(pickle.dumps((key, creds), protocol=pickle.HIGHEST_PROTOCOL))
+        # --------------------------------------------------
+        # the pickle embeds the private key: owner-only perms
+        # --------------------------------------------------
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, cache_file)
+    except (OSError, pickle.PickleError):
+        logging.debug("could not cache service-account credentials", exc_info=True)
+    return creds
 
 
 @dataclass
@@ -41,16 +141,72 @@ class GoogleSpreadsheet:
     spreadsheet_id: str
     spreadsheet_url: str
     service: Any
-    sheet_credentials: service_account.Credentials
-    sheet: Optional[Any]
+    sheet_credentials: Any  # service_account.Credentials (imported lazily)
+    sheet: Any
+    # --------------------------------------------------
+    # per-run memo: duplicate range requests short-circuit
+    # instead of paying another API round-trip
+    # --------------------------------------------------
+    _cache: dict[str, Any] = field(default_factory=dict)
 
     def query(self, range: str) -> Any:
-        if isinstance(self.sheet, type(None)):
-            with LogTimer("initializing Google Sheets API client"):
-                self.sheet = self.service.spreadsheets()
+        if range in self._cache:
+            return self._cache[range]
         with LogTimer(f"querying range '{range}'"):
             result = self.sheet.values().get(spreadsheetId=self.spreadsheet_id, range=range).execute()  # type: ignore
-        return result.get("values", [])
+        values = result.get("values", [])
+        self._cache[range] = values
+        return values
+
+    def batch_query(self, ranges: List[str]) -> dict[str, Any]:
+        """Fetches several ranges in one `values.batchGet` round-trip instead
+        of one HTTPS request per range. Returns a dict keyed by the requested
+        range strings (the API echoes ranges back normalized, but preserves
+        request order)."""
+        with LogTimer(f"batch querying {len(ranges)} ranges"):
+            try:
+                result = self.sheet.values().batchGet(spreadsheetId=self.spreadsheet_id, ranges=ranges).execute()  # type: ignore
+            except Exception:
+                logging.exception(
+                    "batchGet failed, falling back to parallel per-range queries"
+                )
+                return self.query_many(ranges)
+        value_ranges = result.get("valueRanges", [])
+        values = {rng: vr.get("values", []) for rng, vr in zip(ranges, value_ranges)}
+        # --------------------------------------------------
+        # seed the memo so later single-range queries hit
+        # --------------------------------------------------
+        self._cache.update(values)
+        return values
+
+    def query_many(self, ranges: List[str]) -> dict[str, Any]:
+        """Fetches each range with its own `values.get`, but concurrently:
+        the work is pure I/O, so wall time is roughly the slowest single
+        fetch instead of the sum. Fallback for when `batch_query`'s single
+        batchGet round-trip is unavailable."""
+
+        def fetch(range: str) -> Any:
+            # --------------------------------------------------
+            # httplib2 transports are not thread-safe, so each
+            # worker authorizes its own
+            # --------------------------------------------------
+            import httplib2
+            import google_auth_httplib2  # type: ignore
+
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.sheet_credentials, http=httplib2.Http(timeout=30)
+            )
+            with LogTimer(f"querying range '{range}'"):
+                result = self.sheet.values().get(spreadsheetId=self.spreadsheet_id, range=range).execute(http=http)  # type: ignore
+            return result.get("values", [])
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            return dict(zip(ranges, ex.map(fetch, ranges)))
+
+    def query_column(self, range: str) -> List[str]:
+        """Fetches a single-column range and flattens the API's
+        list-of-single-cell-rows shape into a flat list of cells."""
+        return _flatten_column(self.query(range))
 
 
 @dataclass
@@ -72,14 +228,26 @@ class BudgetRecipientAccount:
     def query(self, range: str) -> Any:
         return self.sheet.query(range)
 
+    def batch_query(self, ranges: List[str]) -> dict[str, Any]:
+        return self.sheet.batch_query(ranges)
+
 
 @dataclass
 class GoogleAccount:
     email: str
     app_password: str
-    recipient: BudgetRecipientAccount
+    recipients: List[BudgetRecipientAccount]
+
+    def __init__(self, cfg: dict[str, Any], names: List[str]):
+        # --------------------------------------------------
+        # deferred imports: the google client stack costs
+        # hundreds of ms to import and is not needed for
+        # --help or early config errors
+        # --------------------------------------------------
+        import httplib2
+        import google_auth_httplib2  # type: ignore
+        from googleapiclient.discovery import build  # type: ignore
 
-    def __init__(self, cfg: dict[str, Any], name: str):
         # --------------------------------------------------
         # check to see if email
         # --------------------------------------------------
@@ -97,12 +265,18 @@ class GoogleAccount:
         APP_PWD_PATH_KEY = "from-gmail-app-pwd-file"
         if APP_PWD_PATH_KEY in cfg:
             app_pwd_path = Path(cfg[APP_PWD_PATH_KEY])
-            if not app_pwd_path.is_file():
+            # --------------------------------------------------
+            # read directly instead of is_file() + read: one
+            # syscall pair instead of two, and no TOCTOU gap
+            # --------------------------------------------------
+            try:
+                # strip once: a trailing newline in the file would
+                # otherwise ride along into SMTP AUTH
+                app_password = app_pwd_path.read_text().strip()
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"App main password file not found: {app_pwd_path}"
-                )
-            else:
-                app_password = app_pwd_path.read_text()
+                ) from None
         else:
             raise ValueError(
                 "No app main password provided in configuration file: {}".format(
@@ -111,27 +285,43 @@ class GoogleAccount:
             )
 
         # --------------------------------------------------
-        # loop through accounts
+        # look up each account directly; recipients sharing a
+        # service-account file also share one credentials +
+        # service pair, so auth and client construction are
+        # paid once per key file rather than once per name
         # --------------------------------------------------
         NAME_KEY = "name"
         EMAIL_KEY = "email"
         SPREADSHEET_ID_KEY = "spreadsheet-id"
         SERVICE_ACCOUNT_FILE_KEY = "service-account-file"
-        recipient_account = None
-        for account_name in cfg["accounts"]:
-            if name == account_name:
-                full_name = cfg["accounts"][account_name][NAME_KEY]
-                recipient_email = cfg["accounts"][account_name][EMAIL_KEY]
-                spreadsheet_id = cfg["accounts"][account_name][SPREADSHEET_ID_KEY]
-                service_account_path = cfg["accounts"][account_name][
-                    SERVICE_ACCOUNT_FILE_KEY
-                ]
-                sheet_credentials = service_account.Credentials.from_service_account_file(  # type: ignore
-                    service_account_path,
-                    scopes=["https://www.googleapis.com/auth/spreadsheets.readonly"],
+        services: dict[str, Any] = {}  # service-account-file -> (creds, service)
+        recipients: List[BudgetRecipientAccount] = []
+        for name in names:
+            acct = cfg["accounts"].get(name)
+            if acct is None:
+                raise ValueError("No account found with name: {}".format(name))
+            full_name = acct[NAME_KEY]
+            recipient_email = acct[EMAIL_KEY]
+            spreadsheet_id = acct[SPREADSHEET_ID_KEY]
+            service_account_path = acct[SERVICE_ACCOUNT_FILE_KEY]
+            if service_account_path not in services:
+                sheet_credentials = _load_credentials(service_account_path)
+                # --------------------------------------------------
+                # one authorized transport reused across queries:
+                # httplib2 keeps the TLS connection alive, so only
+                # the first request pays the TCP+TLS handshake.
+                # static_discovery builds the client from the
+                # discovery doc bundled with the library, so no
+                # HTTPS fetch or cache lookup happens at all
+                # --------------------------------------------------
+                http = google_auth_httplib2.AuthorizedHttp(
+                    sheet_credentials, http=httplib2.Http(timeout=30)
                 )
-                service = build("sheets", "v4", credentials=sheet_credentials)  # type: ignore
-                recipient_account = BudgetRecipientAccount(
+                service = build("sheets", "v4", http=http, cache_discovery=False, static_discovery=True)  # type: ignore
+                services[service_account_path] = (sheet_credentials, service)
+            sheet_credentials, service = services[service_account_path]
+            recipients.append(
+                BudgetRecipientAccount(
                     name=name,
                     email=recipient_email,
                     full_name=full_name,
@@ -140,32 +330,227 @@ class GoogleAccount:
                         spreadsheet_url=f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
                         service=service,
                         sheet_credentials=sheet_credentials,
-                        sheet=None,
+                        sheet=service.spreadsheets(),
                     ),
                 )
-                break
-        if recipient_account is None:
-            raise ValueError("No account found with name: {}".format(name))
+            )
 
         # --------------------------------------------------
         # return
         # --------------------------------------------------
         self.email = from_email
         self.app_password = app_password
-        self.recipient = recipient_account
+        self.recipients = recipients
+
+
+def _next_run_at(time_str: str) -> float:
+    """Returns the epoch timestamp of the next occurrence of the configured
+    send time (e.g. "8:00 AM"), rolling to tomorrow if today's has passed."""
+    from datetime import datetime, timedelta
+
+    for fmt in ("%I:%M %p", "%I:%M%p", "%H:%M"):
+        try:
+            at = datetime.strptime(time_str, fmt).time()
+            break
+        except ValueError:
+            continue
+    else:
+        raise ValueError(f"Could not parse send time: {time_str}")
+    now = datetime.now()
+    run = datetime.combine(now.date(), at)
+    if run <= now:
+        run += timedelta(days=1)
+    return run.timestamp()
+
+
+def run_reminder(
+    args: argparse.Namespace,
+    account: GoogleAccount,
+    recipient: BudgetRecipientAccount,
+    client: Any,
+    custom_alert: Any,
+):
+    """One full fetch -> render -> deliver cycle for one recipient. `client`
+    is a long-lived EmailClient (None for the debug / dry-run paths); in
+    daemon mode the same account and client are reused across cycles."""
+    # --------------------------------------------------
+    # kick off the horoscope fetch immediately: it is an
+    # independent network call, so it overlaps with the
+    # sheets queries below instead of running after them
+    # --------------------------------------------------
+    horoscope_future = (
+        ThreadPoolExecutor(max_workers=1).submit(
+            get_horoscope_for_birthday, args.birthday
+        )
+        if args.birthday
+        else None
+    )
+
+    # --------------------------------------------------
+    # fetch every range in one batchGet round-trip; the
+    # serial per-range queries each paid a full HTTPS
+    # request to the Sheets API
+    # --------------------------------------------------
+    values = recipient.batch_query(
+        [
+            "Categories!C:Z",
+            "Budgeting!AG2:AH4",
+            "Accounts!A2:D",
+            "Overview!B2:E",
+            "Overview!G2:I",
+            "Budgeting!Y2:AB",
+            "Budgeting!H2:K",
+            "Budgeting!O2:V",
+            "Accounts!I:I",
+            "Budget Calc!A5:A10",
+        ]
+    )
+
+    # --------------------------------------------------
+    # get categories
+    # --------------------------------------------------
+    categories_sheet = values["Categories!C:Z"]
+    keys = categories_sheet[0]
+    # --------------------------------------------------
+    # transpose once and build each category's list with
+    # a single comprehension instead of nested per-cell
+    # loops. zip_longest pads the ragged rows the API
+    # returns, so short rows never truncate a column
+    # --------------------------------------------------
+    cat2subcat: dict[str, List[str]] = {key: [] for key in keys}
+    for key, col in zip(keys, zip_longest(*categories_sheet[1:], fillvalue="")):
+        cat2subcat[key] = [value for value in col if value]
+
+    # --------------------------------------------------
+    # get period size, start, end date
+    # --------------------------------------------------
+    # --------------------------------------------------
+    # one AG2:AH4 block instead of three single-cell
+    # fetches: AG2 = start, AG4 = end, AH2 = period size
+    # --------------------------------------------------
+    block = values["Budgeting!AG2:AH4"]
+    period_size = float(block[0][1])
+    start_date = parse_mdy(block[0][0])
+    end_date = parse_mdy(block[2][0])
+    # spent = parse_money(account.query("Overview!$A$6")[0][0])
+
+    # --------------------------------------------------
+    # get account balances
+    # --------------------------------------------------
+    account_balances = primitives.AccountBalance.from_rows(
+        values["Accounts!A2:D"]
+    )
+
+    # --------------------------------------------------
+    # get spendable overview
+    # --------------------------------------------------
+    spendable_overviews = primitives.SpendableOverview.from_range(
+        values["Overview!B2:E"]
+    )
+
+    # --------------------------------------------------
+    # get transfer overview
+    # --------------------------------------------------
+    transfer_overviews = primitives.TransferOverview.from_range(
+        values["Overview!G2:I"]
+    )
+
+    # --------------------------------------------------
+    # get payments / savings overviews
+    # --------------------------------------------------
+    overview = values["Budgeting!Y2:AB"]
+    payments_overviews = primitives.PaymentsOverview.from_range(overview)
+    savings_overviews = primitives.SavingsOverview.from_range(overview)
+
+    # --------------------------------------------------
+    # get budgets
+    # --------------------------------------------------
+    budgets: List[primitives.Budget] = []
+    budgets += primitives.Budget.from_manual_budget_range(
+        period_size=period_size,
+        rows=values["Budgeting!H2:K"],
+    )
+    budgets += primitives.Budget.from_recurring_budget_range(
+        cat2subcat=cat2subcat,
+        rows=values["Budgeting!O2:V"],
+    )
+    budgets.sort(
+        # bind the sentinel as a default so the key avoids a
+        # global date.min attribute lookup per element
+        key=lambda b, _min=date.min: b.next_approx_payment or _min
+    )  # sort by next approx payment date, None goes to the beginning
+
+    # --------------------------------------------------
+    # budget stats
+    # --------------------------------------------------
+    budget_stats = primitives.BudgetStats.from_rows(
+        cells=_flatten_column(values["Accounts!I:I"])
+    )
+    spent_categorized = primitives.Bss.from_rows(
+        cells=_flatten_column(values["Budget Calc!A5:A10"])
+    )
+
+    # --------------------------------------------------
+    # collect the horoscope kicked off before the sheets
+    # queries (usually already done by now)
+    # --------------------------------------------------
+    horoscope = None
+    horoscope_url = None
+    if horoscope_future is not None:
+        with LogTimer("waiting on horoscope fetch"):
+            horoscope_result = horoscope_future.result()
+        if isinstance(horoscope_result, tuple):
+            horoscope, horoscope_url = horoscope_result
+
+    # --------------------------------------------------
+    # get summary and render html
+    # --------------------------------------------------
+    budget_summary = primitives.Summary(
+        meta=primitives.BudgetMetadata(
+            name=recipient.full_name,
+            spreadsheet_url=recipient.sheet.spreadsheet_url,
+        ),
+        time=str(args.time),
+        start_date=start_date,
+        end_date=end_date,
+        period_size=period_size,
+        spent_categorized=spent_categorized,
+        account_balances=account_balances,
+        spendable_overviews=spendable_overviews,
+        payments_overviews=payments_overviews,
+        savings_overviews=savings_overviews,
+        budgets=budgets,
+        budget_stats=budget_stats,
+        transfer_overviews=transfer_overviews,
+        horoscope=horoscope,
+        horoscope_url=horoscope_url,
+        custom_alert=custom_alert,
+    )
 
-    def query(self, range: str) -> List[Any]:
-        return self.recipient.query(range)
+    if args.debug:
+        debug_mode(budget_summary, template_name=args.template, port=args.port)
+    elif args.dry_run:
+        print(budget_summary.to_email_html(args.template))
+    else:
+        with LogTimer("render and send email"):
+            client.send_email(
+                subject=budget_summary.to_email_subject(),
+                body_html=budget_summary.to_email_html(args.template),
+                to=[recipient.email],
+                cc=[],
+                bcc=[account.email],
+            )
 
 
 def main():
     parser = argparse.ArgumentParser(description="Send budget reminder")
     parser.add_argument(
         "--for",
-        dest="account_name",
+        dest="account_names",
         type=str,
+        nargs="+",
         required=True,
-        help="Name of the account to send reminder for",
+        help="Name(s) of the account(s) to send reminders for",
     )
     parser.add_argument(
         "--at",
@@ -212,6 +597,11 @@ def main():
         action="store_true",
         help="Debug mode: watch template for changes, render to output.html, and serve via HTTP. Press Ctrl+C to quit.",
     )
+    mode_group.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and send the reminder at the --at time every day, reusing the Sheets service and SMTP connection across runs instead of paying full startup cost per cron invocation.",
+    )
     parser.add_argument(
         "--port",
         dest="port",
@@ -229,23 +619,15 @@ def main():
     args = parser.parse_args()
 
     # --------------------------------------------------
-    # update logger if log file is different from default
+    # configure logging straight to the requested file
     # --------------------------------------------------
-    if args.log_file != DEFAULT_LOG_FILE:
-        # --------------------------------------------------
-        # remove existing handlers to close the file and avoid duplicate logs
-        # --------------------------------------------------
-        logger = logging.getLogger()
-        for h in logger.handlers[:]:
-            logger.removeHandler(h)
-            h.close()
-        # --------------------------------------------------
-        # add new file handler
-        # --------------------------------------------------
-        new_handler = logging.FileHandler(args.log_file, mode="a")
-        new_handler.setFormatter(logging.Formatter(DEFAULT_LOG_FORMAT))
-        logger.addHandler(new_handler)
-        logger.setLevel(DEFAULT_LOG_LEVEL)
+    logging.basicConfig(
+        level=DEFAULT_LOG_LEVEL,
+        format=DEFAULT_LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(args.log_file, mode="a"),  # always append
+        ],
+    )
 
     # --------------------------------------------------
     # process custom alert (if provided)
@@ -268,145 +650,55 @@ def main():
     # get config
     # --------------------------------------------------
     cfg_path = Path(args.cfg)
-    if not cfg_path.is_file():
-        raise FileNotFoundError(f"Configuration file not found: {cfg_path}")
-    else:
-        cfg = toml.loads(cfg_path.read_text())
-
+    # --------------------------------------------------
+    # no is_file() pre-check: _load_cfg stats the file
+    # anyway, so just translate the miss
+    # --------------------------------------------------
     try:
-        # --------------------------------------------------
-        # connect to google account
-        # --------------------------------------------------
-        account = GoogleAccount(cfg=cfg, name=args.account_name)
-
-        # --------------------------------------------------
-        # get categories
-        # --------------------------------------------------
-        categories_sheet = account.query("Categories!C:Z")
-        keys = categories_sheet[0]
-        cat2subcat: dict[str, List[str]] = {key: [] for key in keys}
-        for row in categories_sheet[1:]:
-            for key, value in zip(keys, row):
-                if value:  # skip empty strings
-                    cat2subcat[key].append(value)
-
-        # --------------------------------------------------
-        # get period size, start, end date
-        # --------------------------------------------------
-        period_size = float(account.query("Budgeting!$AH$2")[0][0])
-        start_date = datetime.strptime(
-            account.query("Budgeting!$AG$2")[0][0], "%m/%d/%Y"
-        ).date()
-        end_date = datetime.strptime(
-            account.query("Budgeting!$AG$4")[0][0], "%m/%d/%Y"
-        ).date()
-        # spent = parse_money(account.query("Overview!$A$6")[0][0])
-
-        # --------------------------------------------------
-        # get account balances
-        # --------------------------------------------------
-        account_balances = primitives.AccountBalance.from_rows(
-            account.query("Accounts!A2:D")
-        )
-
-        # --------------------------------------------------
-        # get spendable overview
-        # --------------------------------------------------
-        spendable_overviews = primitives.SpendableOverview.from_range(
-            account.query("Overview!B2:E")
-        )
-
-        # --------------------------------------------------
-        # get transfer overview
-        # --------------------------------------------------
-        transfer_overviews = primitives.TransferOverview.from_range(
-            account.query("Overview!G2:I")
-        )
-
-        # --------------------------------------------------
-        # get payments / savings overviews
-        # --------------------------------------------------
-        overview = account.query("Budgeting!Y2:AB")
-        payments_overviews = primitives.PaymentsOverview.from_range(overview)
-        savings_overviews = primitives.SavingsOverview.from_range(overview)
-
-        # --------------------------------------------------
-        # get budgets
-        # --------------------------------------------------
-        budgets: List[primitives.Budget] = []
-        budgets += primitives.Budget.from_manual_budget_range(
-            period_size=period_size,
-            rows=account.query("Budgeting!H2:K"),
-        )
-        budgets += primitives.Budget.from_recurring_budget_range(
-            cat2subcat=cat2subcat,
-            rows=account.query("Budgeting!O2:V"),
-        )
-        budgets.sort(
-            key=lambda b: b.next_approx_payment or date.min
-        )  # sort by next approx payment date, None goes to the beginning
-
-        # --------------------------------------------------
-        # budget stats
-        # --------------------------------------------------
-        budget_stats = primitives.BudgetStats.from_rows(
-            rows=account.query("Accounts!I:I")
-        )
-        spent_categorized = primitives.Bss.from_rows(
-            rows=account.query("Budget Calc!A5:A10")
-        )
-
-        # --------------------------------------------------
-        # get horoscope if birthday provided
-        # --------------------------------------------------
-        horoscope = None
-        horoscope_url = None
-        if args.birthday:
-            with LogTimer("fetching horoscope"):
-                horoscope_result = get_horoscope_for_birthday(args.birthday)
-            if isinstance(horoscope_result, tuple):
-                horoscope, horoscope_url = horoscope_result
+        cfg = _load_cfg(cfg_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {cfg_path}") from None
 
+    try:
         # --------------------------------------------------
-        # get summary and render html
+        # connect to google account; the email client (and
+        # its persistent SMTP connection) is long-lived so
+        # daemon cycles reuse both
         # --------------------------------------------------
-        budget_summary = primitives.Summary(
-            meta=primitives.BudgetMetadata(
-                name=account.recipient.full_name,
-                spreadsheet_url=account.recipient.sheet.spreadsheet_url,
-            ),
-            time=str(args.time),
-            start_date=start_date,
-            end_date=end_date,
-            period_size=period_size,
-            spent_categorized=spent_categorized,
-            account_balances=account_balances,
-            spendable_overviews=spendable_overviews,
-            payments_overviews=payments_overviews,
-            savings_overviews=savings_overviews,
-            budgets=budgets,
-            budget_stats=budget_stats,
-            transfer_overviews=transfer_overviews,
-            horoscope=horoscope,
-            horoscope_url=horoscope_url,
-            custom_alert=custom_alert,
+        account = GoogleAccount(cfg=cfg, names=args.account_names)
+        client = (
+            None
+            if args.debug or args.dry_run
+            else email_client.EmailClient(account.email, account.app_password)
         )
 
-        if args.debug:
-            debug_mode(budget_summary, template_name=args.template, port=args.port)
-        elif args.dry_run:
-            print(budget_summary.to_email_html(args.template))
+        if args.daemon:
+            # --------------------------------------------------
+            # resident mode: run at the --at time every day,
+            # amortizing interpreter startup, credential load,
+            # service build and SMTP login across runs. errors
+            # in a cycle are logged and the next run scheduled
+            # --------------------------------------------------
+            scheduler = sched.scheduler(time.time, time.sleep)
+
+            def tick():
+                # one recipient's failure never blocks the rest
+                for recipient in account.recipients:
+                    try:
+                        run_reminder(args, account, recipient, client, custom_alert)
+                    except Exception:
+                        logging.exception(
+                            f"Error during scheduled budget reminder run for '{recipient.name}'"
+                        )
+                scheduler.enterabs(_next_run_at(args.time), 1, tick)
+
+            first = _next_run_at(args.time)
+            logging.info(f"daemon mode: first run at {time.ctime(first)}")
+            scheduler.enterabs(first, 1, tick)
+            scheduler.run()
         else:
-            with LogTimer("render and send email"):
-                email_client.EmailClient(
-                    account.email, account.app_password
-                ).send_email(
-                    subject=budget_summary.to_email_subject(),
-                    body_html=budget_summary.to_email_html(args.template),
-                    to=[account.recipient.email],
-                    cc=[],
-                    bcc=[account.email],
-                )
+            for recipient in account.recipients:
+                run_reminder(args, account, recipient, client, custom_alert)
 
     except Exception as e:
         logging.exception("Error occurred during budget reminder execution")